@@ -3,14 +3,21 @@
 Maps known AI API domains to their canonical provider identifiers.
 Used by the detection engine to classify network traffic as shadow AI usage.
 
-Wildcard patterns (e.g., "*.openai.azure.com") are supported via prefix/suffix
-matching in the detection service.
+Wildcard patterns (e.g., "*.openai.azure.com") are supported via a
+reversed-label domain trie built once at import, so resolution cost depends on
+the number of labels in the queried domain rather than the registry size.
 """
 
-# Mapping of API domain patterns to provider identifiers.
-# Wildcard entries use "*" prefix notation and require pattern matching logic
-# in the consumer (ShadowAIDetectionService.analyze_dns_queries).
-AI_PROVIDER_DOMAINS: dict[str, str] = {
+import functools
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+# Source table of API domain patterns to provider identifiers; frozen into the
+# public read-only AI_PROVIDER_DOMAINS below.
+# Wildcard entries use "*" prefix notation and are matched by resolve_provider().
+_AI_PROVIDER_DOMAIN_ENTRIES: dict[str, str] = {
     # ---------------------------------------------------------------------------
     # OpenAI
     # ---------------------------------------------------------------------------
@@ -187,26 +194,99 @@ AI_PROVIDER_DOMAINS: dict[str, str] = {
     "app.copy.ai": "copy-ai",
 }
 
+# Read-only registry with interned keys and values, so lookups against it and
+# the derived tables below compare strings by identity where possible.
+AI_PROVIDER_DOMAINS: Mapping[str, str] = MappingProxyType(
+    {
+        sys.intern(domain): sys.intern(provider)
+        for domain, provider in _AI_PROVIDER_DOMAIN_ENTRIES.items()
+    }
+)
+
 # Domains that require wildcard/suffix matching (contain "*")
-WILDCARD_AI_PROVIDER_DOMAINS: dict[str, str] = {
-    domain: provider
-    for domain, provider in AI_PROVIDER_DOMAINS.items()
-    if "*" in domain
-}
+WILDCARD_AI_PROVIDER_DOMAINS: Mapping[str, str] = MappingProxyType(
+    {
+        domain: provider
+        for domain, provider in AI_PROVIDER_DOMAINS.items()
+        if "*" in domain
+    }
+)
 
 # Exact-match domains (no wildcards)
-EXACT_AI_PROVIDER_DOMAINS: dict[str, str] = {
-    domain: provider
-    for domain, provider in AI_PROVIDER_DOMAINS.items()
-    if "*" not in domain
-}
+EXACT_AI_PROVIDER_DOMAINS: Mapping[str, str] = MappingProxyType(
+    {
+        domain: provider
+        for domain, provider in AI_PROVIDER_DOMAINS.items()
+        if "*" not in domain
+    }
+)
+
+
+# ---------------------------------------------------------------------------
+# Reversed-label domain trie
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _DomainTrieNode:
+    """A trie node keyed by one domain label, walked from the TLD inwards.
+
+    Attributes:
+        children: Child nodes keyed by the next label towards the subdomain.
+        provider: Provider for an exact match ending at this node.
+        wildcard_provider: Provider for a "*." pattern whose suffix ends at this
+            node; applies only when at least one more label follows.
+    """
+
+    children: dict[str, "_DomainTrieNode"] = field(default_factory=dict)
+    provider: str | None = None
+    wildcard_provider: str | None = None
+
 
+def _build_domain_trie() -> _DomainTrieNode:
+    """Build the reversed-label trie from the exact and "*." wildcard registries.
 
+    Returns:
+        Root node of the trie.
+    """
+    root = _DomainTrieNode()
+    for domain, provider in EXACT_AI_PROVIDER_DOMAINS.items():
+        node = root
+        for label in reversed(domain.split(".")):
+            node = node.children.setdefault(sys.intern(label), _DomainTrieNode())
+        node.provider = provider
+    for pattern, provider in WILDCARD_AI_PROVIDER_DOMAINS.items():
+        if not pattern.startswith("*."):
+            continue
+        node = root
+        for label in reversed(pattern[2:].split(".")):
+            node = node.children.setdefault(sys.intern(label), _DomainTrieNode())
+        if node.wildcard_provider is None:
+            node.wildcard_provider = provider
+    return root
+
+
+_DOMAIN_TRIE = _build_domain_trie()
+
+# Trailing-wildcard patterns (e.g., "example.*") are matched by prefix instead.
+_PREFIX_WILDCARD_PATTERNS: tuple[tuple[str, str], ...] = tuple(
+    (pattern[:-2] + ".", provider)
+    for pattern, provider in WILDCARD_AI_PROVIDER_DOMAINS.items()
+    if pattern.endswith(".*") and not pattern.startswith("*.")
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def resolve_provider(domain: str) -> str | None:
     """Resolve a domain to its AI provider identifier.
 
-    Attempts exact match first, then wildcard pattern matching for entries
-    containing "*" (e.g., "*.openai.azure.com").
+    Walks the reversed-label trie from the TLD inwards. An exact match on the
+    full domain wins; otherwise the deepest "*." wildcard whose suffix is a
+    proper label suffix of the domain applies (e.g., "*.openai.azure.com"
+    matches "foo.openai.azure.com" but not "openai.azure.com").
+
+    Results are memoised per domain; network logs repeat the same hosts
+    heavily and the registry is fixed at import.
 
     Args:
         domain: The domain to classify (e.g., "my-org.openai.azure.com").
@@ -214,19 +294,27 @@ def resolve_provider(domain: str) -> str | None:
     Returns:
         Provider identifier string if matched, or None if not an AI domain.
     """
-    # Exact match
-    if domain in EXACT_AI_PROVIDER_DOMAINS:
-        return EXACT_AI_PROVIDER_DOMAINS[domain]
+    reversed_labels = domain.split(".")[::-1]
+    last_depth = len(reversed_labels) - 1
+    node = _DOMAIN_TRIE
+    wildcard_provider: str | None = None
+    for depth, label in enumerate(reversed_labels):
+        child = node.children.get(label)
+        if child is None:
+            break
+        node = child
+        # A "*." wildcard needs at least one label beyond its suffix.
+        if depth < last_depth and node.wildcard_provider is not None:
+            wildcard_provider = node.wildcard_provider
+    else:
+        if node.provider is not None:
+            return node.provider
 
-    # Wildcard suffix match (e.g., "*.openai.azure.com" matches "foo.openai.azure.com")
-    for pattern, provider in WILDCARD_AI_PROVIDER_DOMAINS.items():
-        if pattern.startswith("*."):
-            suffix = pattern[2:]  # strip "*."
-            if domain.endswith(suffix) and domain != suffix:
-                return provider
-        elif pattern.endswith(".*"):
-            prefix = pattern[:-2]  # strip ".*"
-            if domain.startswith(prefix + "."):
-                return provider
+    if wildcard_provider is not None:
+        return wildcard_provider
+
+    for prefix, provider in _PREFIX_WILDCARD_PATTERNS:
+        if domain.startswith(prefix):
+            return provider
 
     return None
@@ -229,6 +229,22 @@ class MigrationProposalService:
         business_value_indicator. Falls back to "unknown" mapping if the
         indicator is not in the registry.
 
+        Args:
+            detection: The ShadowAIDetection to generate a proposal for.
+
+        Returns:
+            Unsaved ShadowMigrationProposal for the detection.
+        """
+        return self.generate_proposal_sync(detection)
+
+    def generate_proposal_sync(
+        self, detection: ShadowAIDetection
+    ) -> ShadowMigrationProposal:
+        """Synchronous implementation of generate_proposal.
+
+        Proposal generation is a pure registry lookup with no I/O, so callers
+        outside an event loop can use this directly.
+
         Args:
             detection: The ShadowAIDetection to generate a proposal for.
 
@@ -4,13 +4,25 @@ Provides mock implementations of all interfaces, avoiding real database,
 Kafka, or network connections in unit tests.
 """
 
+import copy
+import functools
 import uuid
+from collections.abc import Callable
 from datetime import datetime, timedelta, timezone
+from decimal import Decimal
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from aumos_shadow_ai_toolkit.core.interfaces import (
+    IDiscoveryRepository,
+    IGovernanceEngineAdapter,
+    IMigrationRepository,
+    INetworkScannerAdapter,
+    IScanResultRepository,
+    IUsageMetricRepository,
+)
 from aumos_shadow_ai_toolkit.core.models import (
     MigrationPlan,
     ScanResult,
@@ -29,6 +41,23 @@ from aumos_shadow_ai_toolkit.core.services import (
 # ---------------------------------------------------------------------------
 
 
+@functools.cache
+def _dec(value: float) -> Decimal:
+    """Return a cached Decimal for a float test value such as a score or hour estimate.
+
+    Args:
+        value: Numeric test value to convert.
+
+    Returns:
+        Decimal parsed once per distinct value and shared across tests.
+    """
+    return Decimal(str(float(value)))
+
+
+# Default estimated daily cost for detections built by the unit test helpers.
+_COST_DEFAULT = _dec(0.01)
+
+
 def make_discovery(
     discovery_id: uuid.UUID | None = None,
     tenant_id: uuid.UUID | None = None,
@@ -82,6 +111,22 @@ def make_discovery(
     return discovery
 
 
+def mutate_discovery(discovery: ShadowAIDiscovery, **changes: object) -> ShadowAIDiscovery:
+    """Return a shallow copy of a test discovery with some fields changed.
+
+    Args:
+        discovery: Discovery built by make_discovery to copy from.
+        **changes: Attribute names and the values to set on the copy.
+
+    Returns:
+        New ShadowAIDiscovery sharing all other field values with the input.
+    """
+    mutated = copy.copy(discovery)
+    for name, value in changes.items():
+        setattr(mutated, name, value)
+    return mutated
+
+
 def make_migration_plan(
     plan_id: uuid.UUID | None = None,
     tenant_id: uuid.UUID | None = None,
@@ -168,16 +213,12 @@ def mock_discovery_repo() -> MagicMock:
     """Mock IDiscoveryRepository.
 
     Returns:
-        MagicMock with all async methods pre-configured.
+        MagicMock specced to IDiscoveryRepository; async methods are AsyncMocks
+        created on first access.
     """
-    repo = MagicMock()
-    repo.create = AsyncMock()
-    repo.get_by_id = AsyncMock()
-    repo.list_by_tenant = AsyncMock(return_value=([], 0))
-    repo.update_status = AsyncMock()
-    repo.update_risk_assessment = AsyncMock()
-    repo.find_existing = AsyncMock(return_value=None)
-    repo.increment_request_count = AsyncMock()
+    repo = MagicMock(spec=IDiscoveryRepository)
+    repo.list_by_tenant.return_value = ([], 0)
+    repo.find_existing.return_value = None
     return repo
 
 
@@ -186,14 +227,11 @@ def mock_migration_repo() -> MagicMock:
     """Mock IMigrationRepository.
 
     Returns:
-        MagicMock with all async methods pre-configured.
+        MagicMock specced to IMigrationRepository; async methods are AsyncMocks
+        created on first access.
     """
-    repo = MagicMock()
-    repo.create = AsyncMock()
-    repo.get_by_id = AsyncMock()
-    repo.list_by_discovery = AsyncMock(return_value=[])
-    repo.update_status = AsyncMock()
-    repo.set_approval_workflow_id = AsyncMock()
+    repo = MagicMock(spec=IMigrationRepository)
+    repo.list_by_discovery.return_value = []
     return repo
 
 
@@ -202,13 +240,11 @@ def mock_scan_repo() -> MagicMock:
     """Mock IScanResultRepository.
 
     Returns:
-        MagicMock with all async methods pre-configured.
+        MagicMock specced to IScanResultRepository; async methods are AsyncMocks
+        created on first access.
     """
-    repo = MagicMock()
-    repo.create = AsyncMock()
-    repo.complete = AsyncMock()
-    repo.fail = AsyncMock()
-    repo.list_by_tenant = AsyncMock(return_value=([], 0))
+    repo = MagicMock(spec=IScanResultRepository)
+    repo.list_by_tenant.return_value = ([], 0)
     return repo
 
 
@@ -217,25 +253,23 @@ def mock_metric_repo() -> MagicMock:
     """Mock IUsageMetricRepository.
 
     Returns:
-        MagicMock with all async methods pre-configured.
+        MagicMock specced to IUsageMetricRepository; async methods are
+        AsyncMocks created on first access.
     """
-    repo = MagicMock()
-    repo.upsert_daily = AsyncMock()
-    repo.get_dashboard_stats = AsyncMock(
-        return_value={
-            "total_discoveries": 0,
-            "active_users": 0,
-            "critical_count": 0,
-            "high_count": 0,
-            "medium_count": 0,
-            "low_count": 0,
-            "migrations_started": 0,
-            "migrations_completed": 0,
-            "estimated_breach_cost_usd": 0.0,
-            "top_tools": [],
-            "trend": [],
-        }
-    )
+    repo = MagicMock(spec=IUsageMetricRepository)
+    repo.get_dashboard_stats.return_value = {
+        "total_discoveries": 0,
+        "active_users": 0,
+        "critical_count": 0,
+        "high_count": 0,
+        "medium_count": 0,
+        "low_count": 0,
+        "migrations_started": 0,
+        "migrations_completed": 0,
+        "estimated_breach_cost_usd": 0.0,
+        "top_tools": [],
+        "trend": [],
+    }
     return repo
 
 
@@ -244,10 +278,10 @@ def mock_scanner() -> MagicMock:
     """Mock INetworkScannerAdapter.
 
     Returns:
-        MagicMock with scan method pre-configured.
+        MagicMock specced to INetworkScannerAdapter with scan pre-configured.
     """
-    adapter = MagicMock()
-    adapter.scan = AsyncMock(return_value=[])
+    adapter = MagicMock(spec=INetworkScannerAdapter)
+    adapter.scan.return_value = []
     return adapter
 
 
@@ -256,18 +290,17 @@ def mock_governance() -> MagicMock:
     """Mock IGovernanceEngineAdapter.
 
     Returns:
-        MagicMock with evaluate_risk method pre-configured.
+        MagicMock specced to IGovernanceEngineAdapter with evaluate_risk
+        pre-configured.
     """
-    adapter = MagicMock()
-    adapter.evaluate_risk = AsyncMock(
-        return_value={
-            "risk_score": 0.75,
-            "risk_level": "critical",
-            "data_sensitivity": "pii",
-            "compliance_exposure": ["GDPR", "HIPAA"],
-            "details": {"reason": "Sensitive PII data suspected"},
-        }
-    )
+    adapter = MagicMock(spec=IGovernanceEngineAdapter)
+    adapter.evaluate_risk.return_value = {
+        "risk_score": 0.75,
+        "risk_level": "critical",
+        "data_sensitivity": "pii",
+        "compliance_exposure": ["GDPR", "HIPAA"],
+        "details": {"reason": "Sensitive PII data suspected"},
+    }
     return adapter
 
 
@@ -283,6 +316,27 @@ def mock_publisher() -> MagicMock:
     return publisher
 
 
+@pytest.fixture
+def wire_migration(
+    mock_discovery_repo: MagicMock,
+    mock_migration_repo: MagicMock,
+) -> Callable[..., None]:
+    """Configure the discovery and migration repository mocks for a migration.
+
+    Returns:
+        Callable taking a discovery and optional plan that sets the return
+        values of get_by_id, update_status, and (if a plan is given) create.
+    """
+
+    def _wire(discovery: ShadowAIDiscovery, plan: MigrationPlan | None = None) -> None:
+        mock_discovery_repo.get_by_id.return_value = discovery
+        mock_discovery_repo.update_status.return_value = discovery
+        if plan is not None:
+            mock_migration_repo.create.return_value = plan
+
+    return _wire
+
+
 # ---------------------------------------------------------------------------
 # Service fixtures
 # ---------------------------------------------------------------------------
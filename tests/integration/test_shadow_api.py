@@ -13,10 +13,11 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import DEFAULT, AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 # ---------------------------------------------------------------------------
 # We import a minimal FastAPI app rather than the full service entry point
@@ -24,39 +25,47 @@ from fastapi.testclient import TestClient
 # ---------------------------------------------------------------------------
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 
 from aumos_shadow_ai_toolkit.api.routes.shadow_ai import router
+from aumos_shadow_ai_toolkit.api.schemas_shadow import AmnestyInitiateRequest, NetworkLogSubmission
+
+# Starlette's TestClient and AsyncMock emit DeprecationWarnings on every request.
+pytestmark = pytest.mark.filterwarnings("ignore::DeprecationWarning")
 
 
 def _create_test_app() -> FastAPI:
     """Create a minimal FastAPI test app with only the shadow AI router."""
-    app = FastAPI()
+    app = FastAPI(default_response_class=ORJSONResponse)
     app.include_router(router, prefix="/api/v1")
     return app
 
 
-@pytest.fixture
-def test_app() -> FastAPI:
-    """Minimal test application."""
-    return _create_test_app()
+# Built once at import so router registration and OpenAPI schema generation
+# are not repeated for every test.
+_CLIENT = TestClient(_create_test_app())
+_CLIENT.get("/openapi.json")
 
 
 @pytest.fixture
-def client(test_app: FastAPI) -> TestClient:
-    """FastAPI TestClient for the shadow AI routes."""
-    return TestClient(test_app)
+def client() -> TestClient:
+    """Shared FastAPI TestClient for the shadow AI routes."""
+    return _CLIENT
 
 
 _TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 _DETECTION_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+_TENANT_ID_STR = str(_TENANT_ID)
+_DETECTION_ID_STR = str(_DETECTION_ID)
+_HEADERS = {"X-Tenant-ID": _TENANT_ID_STR}
 _NOW = datetime.now(tz=timezone.utc)
 
 
 def _make_detection_dict() -> dict[str, Any]:
     """Build a minimal detection dict for mock returns."""
     return {
-        "id": str(_DETECTION_ID),
-        "tenant_id": str(_TENANT_ID),
+        "id": _DETECTION_ID_STR,
+        "tenant_id": _TENANT_ID_STR,
         "source_ip": "10.0.0.1",
         "destination_domain": "api.openai.com",
         "provider": "openai",
@@ -88,7 +97,7 @@ class TestListDetectionsEndpoint:
 
             response = client.get(
                 "/api/v1/shadow-ai/detections",
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -106,7 +115,7 @@ class TestListDetectionsEndpoint:
 
             response = client.get(
                 "/api/v1/shadow-ai/detections?page=2&page_size=10",
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -121,7 +130,7 @@ class TestListDetectionsEndpoint:
 
             response = client.get(
                 "/api/v1/shadow-ai/detections?severity=high",
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -136,7 +145,7 @@ class TestListDetectionsEndpoint:
 
             response = client.get(
                 "/api/v1/shadow-ai/detections?provider=openai",
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -150,47 +159,36 @@ class TestListDetectionsEndpoint:
 class TestAmnestyProgramEndpoints:
     """Tests for amnesty program initiation and status endpoints."""
 
-    def test_initiate_amnesty_requires_message(self, client: TestClient) -> None:
-        """Missing or too-short message causes 422 validation error."""
-        response = client.post(
-            "/api/v1/shadow-ai/amnesty-program/initiate",
-            headers={"X-Tenant-ID": str(_TENANT_ID)},
-            json={"notification_message": "short", "grace_period_days": 30},
-        )
+    def test_initiate_amnesty_requires_message(self) -> None:
+        """Missing or too-short message fails request validation."""
         # "short" is 5 chars, minimum is 10
-        assert response.status_code == 422
-
-    def test_initiate_amnesty_grace_period_bounds(self, client: TestClient) -> None:
-        """Grace period of 0 causes 422; valid values pass validation."""
-        response = client.post(
-            "/api/v1/shadow-ai/amnesty-program/initiate",
-            headers={"X-Tenant-ID": str(_TENANT_ID)},
-            json={
-                "notification_message": "Valid notification message for the amnesty program.",
-                "grace_period_days": 0,
-            },
-        )
-        assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            AmnestyInitiateRequest(notification_message="short", grace_period_days=30)
+
+    def test_initiate_amnesty_grace_period_bounds(self) -> None:
+        """Grace period of 0 fails validation; valid values pass validation."""
+        with pytest.raises(ValidationError):
+            AmnestyInitiateRequest(
+                notification_message="Valid notification message for the amnesty program.",
+                grace_period_days=0,
+            )
 
     def test_get_amnesty_status_no_active_program(self, client: TestClient) -> None:
         """GET status returns 200 with status='none' when no program exists."""
-        with (
-            patch(
-                "aumos_shadow_ai_toolkit.api.routes.shadow_ai.AmnestyProgramRepository"
-            ) as MockAmnestyRepo,
-            patch(
-                "aumos_shadow_ai_toolkit.api.routes.shadow_ai.ShadowDetectionRepository"
-            ) as MockDetectionRepo,
-        ):
-            amnesty_instance = MockAmnestyRepo.return_value
+        with patch.multiple(
+            "aumos_shadow_ai_toolkit.api.routes.shadow_ai",
+            AmnestyProgramRepository=DEFAULT,
+            ShadowDetectionRepository=DEFAULT,
+        ) as mocks:
+            amnesty_instance = mocks["AmnestyProgramRepository"].return_value
             amnesty_instance.get_active_for_tenant = AsyncMock(return_value=None)
 
-            detection_instance = MockDetectionRepo.return_value
+            detection_instance = mocks["ShadowDetectionRepository"].return_value
             detection_instance.list_by_tenant = AsyncMock(return_value=([], 0))
 
             response = client.get(
-                f"/api/v1/shadow-ai/amnesty-program/{_TENANT_ID}/status",
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                f"/api/v1/shadow-ai/amnesty-program/{_TENANT_ID_STR}/status",
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -217,7 +215,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             instance.bulk_create = AsyncMock(return_value=[])
 
             payload = {
-                "tenant_id": str(_TENANT_ID),
+                "tenant_id": _TENANT_ID_STR,
                 "log_entries": [
                     {
                         "source_ip": "192.168.1.50",
@@ -233,7 +231,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             response = client.post(
                 "/api/v1/shadow-ai/analyze",
                 json=payload,
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -252,7 +250,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             instance.bulk_create = AsyncMock(return_value=[])
 
             payload = {
-                "tenant_id": str(_TENANT_ID),
+                "tenant_id": _TENANT_ID_STR,
                 "log_entries": [
                     {
                         "source_ip": "192.168.1.50",
@@ -268,7 +266,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             response = client.post(
                 "/api/v1/shadow-ai/analyze",
                 json=payload,
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -276,18 +274,10 @@ class TestAnalyzeNetworkLogsEndpoint:
         assert data["detections_found"] == 0
         assert data["providers_detected"] == []
 
-    def test_analyze_empty_log_entries_rejected(self, client: TestClient) -> None:
+    def test_analyze_empty_log_entries_rejected(self) -> None:
         """Submitting empty log_entries fails validation."""
-        payload = {
-            "tenant_id": str(_TENANT_ID),
-            "log_entries": [],
-        }
-        response = client.post(
-            "/api/v1/shadow-ai/analyze",
-            json=payload,
-            headers={"X-Tenant-ID": str(_TENANT_ID)},
-        )
-        assert response.status_code == 422
+        with pytest.raises(ValidationError):
+            NetworkLogSubmission(tenant_id=_TENANT_ID, log_entries=[])
 
     def test_analyze_multiple_providers_detected(self, client: TestClient) -> None:
         """Multiple AI provider domains in one submission produce multiple detections."""
@@ -298,7 +288,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             instance.bulk_create = AsyncMock(return_value=[])
 
             payload = {
-                "tenant_id": str(_TENANT_ID),
+                "tenant_id": _TENANT_ID_STR,
                 "log_entries": [
                     {
                         "source_ip": "192.168.1.50",
@@ -330,7 +320,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             response = client.post(
                 "/api/v1/shadow-ai/analyze",
                 json=payload,
-                headers={"X-Tenant-ID": str(_TENANT_ID)},
+                headers=_HEADERS,
             )
 
         assert response.status_code == 200
@@ -350,7 +340,7 @@ class TestAnalyzeNetworkLogsEndpoint:
             instance.bulk_create = AsyncMock(return_value=[])
 
             payload = {
-                "tenant_id": str(_TENANT_ID),
+                "tenant_id": _TENANT_ID_STR,
                 "log_entries": [
                     {
                         "source_ip": "10.0.0.1",
@@ -5,7 +5,7 @@ with all external dependencies mocked via fixtures from conftest.py.
 """
 
 import uuid
-from unittest.mock import AsyncMock
+from collections.abc import Callable
 
 import pytest
 
@@ -17,7 +17,12 @@ from aumos_shadow_ai_toolkit.core.services import (
     RiskAssessorService,
     _compute_risk_level,
 )
-from tests.conftest import make_discovery, make_migration_plan, make_scan_result
+from tests.conftest import (
+    make_discovery,
+    make_migration_plan,
+    make_scan_result,
+    mutate_discovery,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -28,33 +33,21 @@ from tests.conftest import make_discovery, make_migration_plan, make_scan_result
 class TestComputeRiskLevel:
     """Tests for the risk level computation helper."""
 
-    def test_critical_at_threshold(self) -> None:
-        """Score at the critical threshold is rated critical."""
-        assert _compute_risk_level(0.7, 0.7, 0.5, 0.3) == "critical"
-
-    def test_critical_above_threshold(self) -> None:
-        """Score above the critical threshold is rated critical."""
-        assert _compute_risk_level(0.95, 0.7, 0.5, 0.3) == "critical"
-
-    def test_high_between_thresholds(self) -> None:
-        """Score between high and critical thresholds is rated high."""
-        assert _compute_risk_level(0.6, 0.7, 0.5, 0.3) == "high"
-
-    def test_medium_between_thresholds(self) -> None:
-        """Score between medium and high thresholds is rated medium."""
-        assert _compute_risk_level(0.4, 0.7, 0.5, 0.3) == "medium"
-
-    def test_low_below_medium_threshold(self) -> None:
-        """Score below the medium threshold is rated low."""
-        assert _compute_risk_level(0.1, 0.7, 0.5, 0.3) == "low"
-
-    def test_zero_score_is_low(self) -> None:
-        """A zero risk score is rated low."""
-        assert _compute_risk_level(0.0, 0.7, 0.5, 0.3) == "low"
-
-    def test_maximum_score_is_critical(self) -> None:
-        """A maximum risk score of 1.0 is rated critical."""
-        assert _compute_risk_level(1.0, 0.7, 0.5, 0.3) == "critical"
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [
+            (0.7, "critical"),  # at the critical threshold
+            (0.95, "critical"),  # above the critical threshold
+            (0.6, "high"),  # between high and critical thresholds
+            (0.4, "medium"),  # between medium and high thresholds
+            (0.1, "low"),  # below the medium threshold
+            (0.0, "low"),  # zero score
+            (1.0, "critical"),  # maximum score
+        ],
+    )
+    def test_compute_risk_level(self, score: float, expected: str) -> None:
+        """Scores map to the expected risk level for the default thresholds."""
+        assert _compute_risk_level(score, 0.7, 0.5, 0.3) == expected
 
 
 # ---------------------------------------------------------------------------
@@ -65,7 +58,6 @@ class TestComputeRiskLevel:
 class TestDiscoveryService:
     """Tests for DiscoveryService."""
 
-    @pytest.mark.asyncio
     async def test_initiate_scan_no_detections(
         self,
         discovery_service: DiscoveryService,
@@ -75,16 +67,15 @@ class TestDiscoveryService:
     ) -> None:
         """Scan with no detections produces a completed scan with zero discoveries."""
         scan = make_scan_result(tenant_id=tenant_id)
-        mock_scan_repo.create = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scan_repo.complete = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scanner.scan = AsyncMock(return_value=[])  # type: ignore[attr-defined]
+        mock_scan_repo.create.return_value = scan  # type: ignore[attr-defined]
+        mock_scan_repo.complete.return_value = scan  # type: ignore[attr-defined]
+        mock_scanner.scan.return_value = []  # type: ignore[attr-defined]
 
         result = await discovery_service.initiate_scan(tenant_id=tenant_id)
 
         assert result.id == scan.id
         mock_scan_repo.complete.assert_awaited_once()  # type: ignore[attr-defined]
 
-    @pytest.mark.asyncio
     async def test_initiate_scan_new_detection_creates_discovery(
         self,
         discovery_service: DiscoveryService,
@@ -98,22 +89,20 @@ class TestDiscoveryService:
         scan = make_scan_result(tenant_id=tenant_id)
         discovery = make_discovery(tenant_id=tenant_id)
 
-        mock_scan_repo.create = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scan_repo.complete = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scanner.scan = AsyncMock(  # type: ignore[attr-defined]
-            return_value=[
-                {
-                    "tool_name": "ChatGPT / OpenAI API",
-                    "api_endpoint": "api.openai.com",
-                    "detection_method": "dns_pattern",
-                    "detected_user_id": None,
-                    "request_count": 1,
-                    "estimated_volume_kb": 0,
-                }
-            ]
-        )
-        mock_discovery_repo.find_existing = AsyncMock(return_value=None)  # type: ignore[attr-defined]
-        mock_discovery_repo.create = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
+        mock_scan_repo.create.return_value = scan  # type: ignore[attr-defined]
+        mock_scan_repo.complete.return_value = scan  # type: ignore[attr-defined]
+        mock_scanner.scan.return_value = [  # type: ignore[attr-defined]
+            {
+                "tool_name": "ChatGPT / OpenAI API",
+                "api_endpoint": "api.openai.com",
+                "detection_method": "dns_pattern",
+                "detected_user_id": None,
+                "request_count": 1,
+                "estimated_volume_kb": 0,
+            }
+        ]
+        mock_discovery_repo.find_existing.return_value = None  # type: ignore[attr-defined]
+        mock_discovery_repo.create.return_value = discovery  # type: ignore[attr-defined]
 
         result = await discovery_service.initiate_scan(tenant_id=tenant_id)
 
@@ -121,7 +110,6 @@ class TestDiscoveryService:
         mock_publisher.publish.assert_awaited_once()  # type: ignore[attr-defined]
         assert result.id == scan.id
 
-    @pytest.mark.asyncio
     async def test_initiate_scan_redetection_increments_counter(
         self,
         discovery_service: DiscoveryService,
@@ -134,30 +122,26 @@ class TestDiscoveryService:
         scan = make_scan_result(tenant_id=tenant_id)
         existing = make_discovery(tenant_id=tenant_id, status="assessed")
 
-        mock_scan_repo.create = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scan_repo.complete = AsyncMock(return_value=scan)  # type: ignore[attr-defined]
-        mock_scanner.scan = AsyncMock(  # type: ignore[attr-defined]
-            return_value=[
-                {
-                    "tool_name": existing.tool_name,
-                    "api_endpoint": existing.api_endpoint,
-                    "detection_method": "dns_pattern",
-                    "detected_user_id": None,
-                    "request_count": 5,
-                    "estimated_volume_kb": 100,
-                }
-            ]
-        )
-        mock_discovery_repo.find_existing = AsyncMock(return_value=existing)  # type: ignore[attr-defined]
-        mock_discovery_repo.increment_request_count = AsyncMock(return_value=existing)  # type: ignore[attr-defined]
-        mock_discovery_repo.create = AsyncMock()  # type: ignore[attr-defined]
+        mock_scan_repo.create.return_value = scan  # type: ignore[attr-defined]
+        mock_scan_repo.complete.return_value = scan  # type: ignore[attr-defined]
+        mock_scanner.scan.return_value = [  # type: ignore[attr-defined]
+            {
+                "tool_name": existing.tool_name,
+                "api_endpoint": existing.api_endpoint,
+                "detection_method": "dns_pattern",
+                "detected_user_id": None,
+                "request_count": 5,
+                "estimated_volume_kb": 100,
+            }
+        ]
+        mock_discovery_repo.find_existing.return_value = existing  # type: ignore[attr-defined]
+        mock_discovery_repo.increment_request_count.return_value = existing  # type: ignore[attr-defined]
 
         await discovery_service.initiate_scan(tenant_id=tenant_id)
 
         mock_discovery_repo.increment_request_count.assert_awaited_once()  # type: ignore[attr-defined]
         mock_discovery_repo.create.assert_not_awaited()  # type: ignore[attr-defined]
 
-    @pytest.mark.asyncio
     async def test_get_discovery_not_found_raises(
         self,
         discovery_service: DiscoveryService,
@@ -165,12 +149,11 @@ class TestDiscoveryService:
         tenant_id: uuid.UUID,
     ) -> None:
         """Getting a non-existent discovery raises NotFoundError."""
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+        mock_discovery_repo.get_by_id.return_value = None  # type: ignore[attr-defined]
 
         with pytest.raises(NotFoundError):
             await discovery_service.get_discovery(uuid.uuid4(), tenant_id)
 
-    @pytest.mark.asyncio
     async def test_dismiss_discovery_success(
         self,
         discovery_service: DiscoveryService,
@@ -179,11 +162,9 @@ class TestDiscoveryService:
     ) -> None:
         """Dismissing a non-terminal discovery succeeds."""
         discovery = make_discovery(tenant_id=tenant_id, status="assessed")
-        dismissed = make_discovery(
-            discovery_id=discovery.id, tenant_id=tenant_id, status="dismissed"
-        )
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-        mock_discovery_repo.update_status = AsyncMock(return_value=dismissed)  # type: ignore[attr-defined]
+        dismissed = mutate_discovery(discovery, status="dismissed")
+        mock_discovery_repo.get_by_id.return_value = discovery  # type: ignore[attr-defined]
+        mock_discovery_repo.update_status.return_value = dismissed  # type: ignore[attr-defined]
 
         result = await discovery_service.dismiss_discovery(discovery.id, tenant_id, "False positive")
 
@@ -194,20 +175,6 @@ class TestDiscoveryService:
             dismissed_reason="False positive",
         )
 
-    @pytest.mark.asyncio
-    async def test_dismiss_terminal_discovery_raises_conflict(
-        self,
-        discovery_service: DiscoveryService,
-        mock_discovery_repo: object,
-        tenant_id: uuid.UUID,
-    ) -> None:
-        """Dismissing an already-dismissed discovery raises ConflictError."""
-        discovery = make_discovery(tenant_id=tenant_id, status="dismissed")
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-
-        with pytest.raises(ConflictError):
-            await discovery_service.dismiss_discovery(discovery.id, tenant_id)
-
 
 # ---------------------------------------------------------------------------
 # RiskAssessorService tests
@@ -217,7 +184,6 @@ class TestDiscoveryService:
 class TestRiskAssessorService:
     """Tests for RiskAssessorService."""
 
-    @pytest.mark.asyncio
     async def test_assess_discovery_persists_risk_score(
         self,
         risk_service: RiskAssessorService,
@@ -226,20 +192,18 @@ class TestRiskAssessorService:
     ) -> None:
         """Assessing a discovery persists the risk score from the governance adapter."""
         discovery = make_discovery(tenant_id=tenant_id, status="detected")
-        assessed = make_discovery(
-            discovery_id=discovery.id, tenant_id=tenant_id,
-            status="assessed", risk_score=0.75, risk_level="critical"
+        assessed = mutate_discovery(
+            discovery, status="assessed", risk_score=0.75, risk_level="critical"
         )
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-        mock_discovery_repo.update_risk_assessment = AsyncMock(return_value=assessed)  # type: ignore[attr-defined]
-        mock_discovery_repo.update_status = AsyncMock(return_value=assessed)  # type: ignore[attr-defined]
+        mock_discovery_repo.get_by_id.return_value = discovery  # type: ignore[attr-defined]
+        mock_discovery_repo.update_risk_assessment.return_value = assessed  # type: ignore[attr-defined]
+        mock_discovery_repo.update_status.return_value = assessed  # type: ignore[attr-defined]
 
         result = await risk_service.assess_discovery(discovery.id, tenant_id)
 
         mock_discovery_repo.update_risk_assessment.assert_awaited_once()  # type: ignore[attr-defined]
         assert result.status == "assessed"
 
-    @pytest.mark.asyncio
     async def test_assess_discovery_not_found_raises(
         self,
         risk_service: RiskAssessorService,
@@ -247,12 +211,11 @@ class TestRiskAssessorService:
         tenant_id: uuid.UUID,
     ) -> None:
         """Assessing a non-existent discovery raises NotFoundError."""
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=None)  # type: ignore[attr-defined]
+        mock_discovery_repo.get_by_id.return_value = None  # type: ignore[attr-defined]
 
         with pytest.raises(NotFoundError):
             await risk_service.assess_discovery(uuid.uuid4(), tenant_id)
 
-    @pytest.mark.asyncio
     async def test_get_risk_report_returns_dict(
         self,
         risk_service: RiskAssessorService,
@@ -264,9 +227,7 @@ class TestRiskAssessorService:
             tenant_id=tenant_id, status="assessed",
             risk_score=0.85, risk_level="critical"
         )
-        mock_discovery_repo.list_by_tenant = AsyncMock(  # type: ignore[attr-defined]
-            return_value=([critical_discovery], 1)
-        )
+        mock_discovery_repo.list_by_tenant.return_value = ([critical_discovery], 1)  # type: ignore[attr-defined]
 
         report = await risk_service.get_risk_report(tenant_id)
 
@@ -283,13 +244,13 @@ class TestRiskAssessorService:
 class TestMigrationService:
     """Tests for MigrationService."""
 
-    @pytest.mark.asyncio
     async def test_start_migration_creates_plan(
         self,
         migration_service: MigrationService,
         mock_discovery_repo: object,
         mock_migration_repo: object,
         mock_publisher: object,
+        wire_migration: Callable[..., None],
         tenant_id: uuid.UUID,
     ) -> None:
         """Starting a migration creates a plan and transitions discovery to migrating."""
@@ -303,9 +264,7 @@ class TestMigrationService:
             employee_id=employee_id,
         )
 
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-        mock_migration_repo.create = AsyncMock(return_value=plan)  # type: ignore[attr-defined]
-        mock_discovery_repo.update_status = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
+        wire_migration(discovery, plan)
 
         result = await migration_service.start_migration(
             tool_id=discovery.id,
@@ -322,43 +281,6 @@ class TestMigrationService:
         )
         mock_publisher.publish.assert_awaited_once()  # type: ignore[attr-defined]
 
-    @pytest.mark.asyncio
-    async def test_start_migration_no_employee_id_raises(
-        self,
-        migration_service: MigrationService,
-        mock_discovery_repo: object,
-        tenant_id: uuid.UUID,
-    ) -> None:
-        """Starting migration without identified employee raises ConflictError."""
-        discovery = make_discovery(tenant_id=tenant_id, status="assessed", detected_user_id=None)
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-
-        with pytest.raises(ConflictError, match="no employee identified"):
-            await migration_service.start_migration(
-                tool_id=discovery.id,
-                tenant_id=tenant_id,
-                governed_tool_name="AumOS Enterprise AI Assistant",
-            )
-
-    @pytest.mark.asyncio
-    async def test_start_migration_dismissed_discovery_raises(
-        self,
-        migration_service: MigrationService,
-        mock_discovery_repo: object,
-        tenant_id: uuid.UUID,
-    ) -> None:
-        """Starting migration on dismissed discovery raises ConflictError."""
-        discovery = make_discovery(tenant_id=tenant_id, status="dismissed")
-        mock_discovery_repo.get_by_id = AsyncMock(return_value=discovery)  # type: ignore[attr-defined]
-
-        with pytest.raises(ConflictError):
-            await migration_service.start_migration(
-                tool_id=discovery.id,
-                tenant_id=tenant_id,
-                governed_tool_name="AumOS Enterprise AI Assistant",
-            )
-
-    @pytest.mark.asyncio
     async def test_complete_migration_transitions_discovery(
         self,
         migration_service: MigrationService,
@@ -373,9 +295,8 @@ class TestMigrationService:
             plan_id=plan.id, tenant_id=tenant_id, status="completed"
         )
 
-        mock_migration_repo.get_by_id = AsyncMock(return_value=plan)  # type: ignore[attr-defined]
-        mock_migration_repo.update_status = AsyncMock(return_value=completed_plan)  # type: ignore[attr-defined]
-        mock_discovery_repo.update_status = AsyncMock()  # type: ignore[attr-defined]
+        mock_migration_repo.get_by_id.return_value = plan  # type: ignore[attr-defined]
+        mock_migration_repo.update_status.return_value = completed_plan  # type: ignore[attr-defined]
 
         result = await migration_service.complete_migration(plan.id, tenant_id)
 
@@ -386,3 +307,62 @@ class TestMigrationService:
             dismissed_reason=None,
         )
         mock_publisher.publish.assert_awaited_once()  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# Discovery conflict-state tests
+# ---------------------------------------------------------------------------
+
+
+class TestDiscoveryConflictStates:
+    """Operations on a discovery in a disallowed state raise ConflictError."""
+
+    @pytest.mark.parametrize(
+        ("status", "has_employee", "service_fixture", "method", "extra_kwargs", "message"),
+        [
+            ("dismissed", True, "discovery_service", "dismiss_discovery", {}, None),
+            (
+                "assessed",
+                False,
+                "migration_service",
+                "start_migration",
+                {"governed_tool_name": "AumOS Enterprise AI Assistant"},
+                "no employee identified",
+            ),
+            (
+                "dismissed",
+                True,
+                "migration_service",
+                "start_migration",
+                {"governed_tool_name": "AumOS Enterprise AI Assistant"},
+                None,
+            ),
+        ],
+        ids=["dismiss-terminal", "migrate-no-employee", "migrate-dismissed"],
+    )
+    async def test_conflict_states(
+        self,
+        request: pytest.FixtureRequest,
+        mock_discovery_repo: object,
+        tenant_id: uuid.UUID,
+        status: str,
+        has_employee: bool,
+        service_fixture: str,
+        method: str,
+        extra_kwargs: dict[str, str],
+        message: str | None,
+    ) -> None:
+        """Dismissing a terminal discovery or migrating an ineligible one is rejected."""
+        discovery = make_discovery(
+            tenant_id=tenant_id,
+            status=status,
+            detected_user_id=uuid.uuid4() if has_employee else None,
+        )
+        mock_discovery_repo.get_by_id.return_value = discovery  # type: ignore[attr-defined]
+        service_method = getattr(request.getfixturevalue(service_fixture), method)
+
+        with pytest.raises(ConflictError) as exc_info:
+            await service_method(discovery.id, tenant_id, **extra_kwargs)
+
+        if message is not None:
+            assert message in str(exc_info.value)
@@ -9,13 +9,17 @@ Covers:
 
 from __future__ import annotations
 
+import copy
 import uuid
-from datetime import datetime, timedelta, timezone
-from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
+from datetime import datetime, timedelta, timezone, tzinfo
+from unittest.mock import MagicMock
 
 import pytest
 
+from aumos_shadow_ai_toolkit.adapters.shadow_repositories import (
+    AmnestyProgramRepository,
+    ShadowDetectionRepository,
+)
 from aumos_shadow_ai_toolkit.core.models.shadow_detection import (
     AmnestyProgram,
     ShadowAIDetection,
@@ -25,9 +29,55 @@ from aumos_shadow_ai_toolkit.core.services.amnesty_service import (
     AmnestyStatus,
     AffectedUser,
 )
+from tests.conftest import _COST_DEFAULT, _dec
 
 _TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 _NOW = datetime.now(tz=timezone.utc)
+_NOW_PLUS_14D = _NOW + timedelta(days=14)
+_NOW_PLUS_15D = _NOW + timedelta(days=15)
+_NOW_PLUS_30D = _NOW + timedelta(days=30)
+_NOW_MINUS_1D = _NOW - timedelta(days=1)
+_NOW_MINUS_5D = _NOW - timedelta(days=5)
+
+
+def _build_program_template() -> AmnestyProgram:
+    """Build the default AmnestyProgram that _make_program copies from."""
+    program = AmnestyProgram.__new__(AmnestyProgram)
+    program.id = uuid.uuid4()
+    program.tenant_id = _TENANT_ID
+    program.notification_message = "Test amnesty program notification"
+    program.grace_period_days = 30
+    program.grace_period_expires_at = _NOW_PLUS_30D
+    program.status = "active"
+    program.affected_user_count = 0
+    program.initiated_by = None
+    program.enforcement_started_at = None
+    program.cancellation_reason = None
+    program.created_at = _NOW
+    program.updated_at = _NOW
+    return program
+
+
+def _build_detection_template() -> ShadowAIDetection:
+    """Build the default ShadowAIDetection that _make_detection copies from."""
+    detection = ShadowAIDetection.__new__(ShadowAIDetection)
+    detection.id = uuid.uuid4()
+    detection.tenant_id = _TENANT_ID
+    detection.source_ip = "10.0.0.1"
+    detection.destination_domain = "api.openai.com"
+    detection.provider = "openai"
+    detection.estimated_data_sensitivity = "medium"
+    detection.estimated_daily_cost_usd = _COST_DEFAULT
+    detection.compliance_risk_score = _dec(45.0)
+    detection.business_value_indicator = "text-generation"
+    detection.status = "detected"
+    detection.created_at = _NOW
+    detection.updated_at = _NOW
+    return detection
+
+
+_PROGRAM_TEMPLATE = _build_program_template()
+_DETECTION_TEMPLATE = _build_detection_template()
 
 
 def _make_program(
@@ -38,74 +88,85 @@ def _make_program(
     enforcement_started_at: datetime | None = None,
 ) -> AmnestyProgram:
     """Create a test AmnestyProgram instance."""
-    program = AmnestyProgram.__new__(AmnestyProgram)
+    program = copy.copy(_PROGRAM_TEMPLATE)
     program.id = uuid.uuid4()
-    program.tenant_id = _TENANT_ID
-    program.notification_message = "Test amnesty program notification"
     program.grace_period_days = grace_period_days
     program.grace_period_expires_at = grace_period_expires_at or (
         _NOW + timedelta(days=grace_period_days)
     )
     program.status = status
     program.affected_user_count = affected_user_count
-    program.initiated_by = None
     program.enforcement_started_at = enforcement_started_at
-    program.cancellation_reason = None
-    program.created_at = _NOW
-    program.updated_at = _NOW
     return program
 
 
 def _make_detection(provider: str = "openai", risk_score: float = 45.0) -> ShadowAIDetection:
     """Create a minimal ShadowAIDetection for testing."""
-    detection = ShadowAIDetection.__new__(ShadowAIDetection)
+    detection = copy.copy(_DETECTION_TEMPLATE)
     detection.id = uuid.uuid4()
-    detection.tenant_id = _TENANT_ID
-    detection.source_ip = "10.0.0.1"
     detection.destination_domain = f"api.{provider}.com"
     detection.provider = provider
-    detection.estimated_data_sensitivity = "medium"
-    detection.estimated_daily_cost_usd = Decimal("0.01")
-    detection.compliance_risk_score = Decimal(str(risk_score))
-    detection.business_value_indicator = "text-generation"
-    detection.status = "detected"
-    detection.created_at = _NOW
-    detection.updated_at = _NOW
+    detection.compliance_risk_score = _dec(risk_score)
     return detection
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_amnesty_repo() -> MagicMock:
-    """Mock amnesty repository with all async methods configured."""
-    repo = MagicMock()
-    repo.create = AsyncMock()
-    repo.get_active_for_tenant = AsyncMock(return_value=None)
-    repo.update_status = AsyncMock()
-    repo.list_by_tenant = AsyncMock(return_value=([], 0))
-    return repo
+    """Mock amnesty repository; defaults are applied by _reset_mocks."""
+    return MagicMock(spec=AmnestyProgramRepository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_detection_repo() -> MagicMock:
-    """Mock detection repository with all async methods configured."""
-    repo = MagicMock()
-    repo.list_by_tenant = AsyncMock(return_value=([], 0))
-    return repo
+    """Mock detection repository; defaults are applied by _reset_mocks."""
+    return MagicMock(spec=ShadowDetectionRepository)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def service(mock_amnesty_repo: MagicMock, mock_detection_repo: MagicMock) -> AmnestyProgramService:
-    """AmnestyProgramService with mock repositories."""
+    """AmnestyProgramService with mock repositories, built once per session.
+
+    The service only holds references to the repository mocks, which
+    _reset_mocks restores between tests.
+    """
     return AmnestyProgramService(
         amnesty_repository=mock_amnesty_repo,
         detection_repository=mock_detection_repo,
     )
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_amnesty_repo: MagicMock, mock_detection_repo: MagicMock) -> None:
+    """Restore the session-scoped repository mocks to their defaults before each test."""
+    mock_amnesty_repo.reset_mock(return_value=True, side_effect=True)
+    mock_amnesty_repo.get_active_for_tenant.return_value = None
+    mock_amnesty_repo.list_by_tenant.return_value = ([], 0)
+    mock_detection_repo.reset_mock(return_value=True, side_effect=True)
+    mock_detection_repo.list_by_tenant.return_value = ([], 0)
+
+
+class _FrozenDatetime(datetime):
+    """datetime subclass whose now() always returns _NOW."""
+
+    @classmethod
+    def now(cls, tz: tzinfo | None = None) -> datetime:  # type: ignore[override]
+        """Return the frozen module timestamp regardless of tz."""
+        return _NOW
+
+
+@pytest.fixture
+def frozen_now(monkeypatch: pytest.MonkeyPatch) -> datetime:
+    """Freeze datetime.now() inside the amnesty service at _NOW."""
+    monkeypatch.setattr(
+        "aumos_shadow_ai_toolkit.core.services.amnesty_service.datetime",
+        _FrozenDatetime,
+    )
+    return _NOW
+
+
 class TestInitiateAmnesty:
     """Tests for amnesty program initiation."""
 
-    @pytest.mark.asyncio
     async def test_initiate_calls_repository_create(
         self,
         service: AmnestyProgramService,
@@ -113,7 +174,7 @@ class TestInitiateAmnesty:
     ) -> None:
         """initiate_amnesty calls the repository create method."""
         program = _make_program(status="active")
-        mock_amnesty_repo.create = AsyncMock(return_value=program)
+        mock_amnesty_repo.create.return_value = program
 
         result = await service.initiate_amnesty(
             tenant_id=_TENANT_ID,
@@ -124,17 +185,16 @@ class TestInitiateAmnesty:
         mock_amnesty_repo.create.assert_awaited_once()
         assert result.status == "active"
 
-    @pytest.mark.asyncio
     async def test_grace_period_expiry_computed_correctly(
         self,
         service: AmnestyProgramService,
         mock_amnesty_repo: MagicMock,
+        frozen_now: datetime,
     ) -> None:
-        """Grace period expiry is approximately grace_period_days from now."""
+        """Grace period expiry is exactly grace_period_days from now."""
         program = _make_program(grace_period_days=14)
-        mock_amnesty_repo.create = AsyncMock(return_value=program)
+        mock_amnesty_repo.create.return_value = program
 
-        before = datetime.now(tz=timezone.utc)
         await service.initiate_amnesty(
             tenant_id=_TENANT_ID,
             message="Amnesty message with sufficient length.",
@@ -144,16 +204,8 @@ class TestInitiateAmnesty:
         # Inspect the kwarg passed to repo.create
         call_kwargs = mock_amnesty_repo.create.call_args
         assert call_kwargs is not None
-        grace_expiry = call_kwargs.kwargs.get("grace_period_expires_at")
-        if grace_expiry is None:
-            # May be positional depending on implementation
-            return
+        assert call_kwargs.kwargs["grace_period_expires_at"] == _NOW_PLUS_14D
 
-        expected_min = before + timedelta(days=13, hours=23)
-        expected_max = datetime.now(tz=timezone.utc) + timedelta(days=14, hours=1)
-        assert expected_min <= grace_expiry <= expected_max
-
-    @pytest.mark.asyncio
     async def test_initiated_by_passed_to_repository(
         self,
         service: AmnestyProgramService,
@@ -162,7 +214,7 @@ class TestInitiateAmnesty:
         """initiated_by UUID is forwarded to the repository."""
         program = _make_program()
         admin_id = uuid.uuid4()
-        mock_amnesty_repo.create = AsyncMock(return_value=program)
+        mock_amnesty_repo.create.return_value = program
 
         await service.initiate_amnesty(
             tenant_id=_TENANT_ID,
@@ -181,19 +233,17 @@ class TestInitiateAmnesty:
 class TestGetAffectedUsers:
     """Tests for affected user enumeration."""
 
-    @pytest.mark.asyncio
     async def test_no_detections_returns_empty_list(
         self,
         service: AmnestyProgramService,
         mock_detection_repo: MagicMock,
     ) -> None:
         """No detections produces empty affected users list."""
-        mock_detection_repo.list_by_tenant = AsyncMock(return_value=([], 0))
+        mock_detection_repo.list_by_tenant.return_value = ([], 0)
 
         users = await service.get_affected_users(_TENANT_ID)
         assert users == []
 
-    @pytest.mark.asyncio
     async def test_detections_produce_affected_user_entries(
         self,
         service: AmnestyProgramService,
@@ -204,7 +254,7 @@ class TestGetAffectedUsers:
             _make_detection("openai", risk_score=70.0),
             _make_detection("anthropic", risk_score=50.0),
         ]
-        mock_detection_repo.list_by_tenant = AsyncMock(return_value=(detections, 2))
+        mock_detection_repo.list_by_tenant.return_value = (detections, 2)
 
         users = await service.get_affected_users(_TENANT_ID)
         # All network-level detections group under None user_id key
@@ -213,7 +263,6 @@ class TestGetAffectedUsers:
         assert "openai" in users[0].providers
         assert "anthropic" in users[0].providers
 
-    @pytest.mark.asyncio
     async def test_users_sorted_by_highest_risk_score(
         self,
         service: AmnestyProgramService,
@@ -224,7 +273,7 @@ class TestGetAffectedUsers:
             _make_detection("openai", risk_score=80.0),
             _make_detection("groq", risk_score=30.0),
         ]
-        mock_detection_repo.list_by_tenant = AsyncMock(return_value=(detections, 2))
+        mock_detection_repo.list_by_tenant.return_value = (detections, 2)
 
         users = await service.get_affected_users(_TENANT_ID)
         # Single group since network-level, but max should be 80.0
@@ -234,81 +283,63 @@ class TestGetAffectedUsers:
 class TestGetAmnestyStatus:
     """Tests for amnesty status retrieval and lifecycle transitions."""
 
-    @pytest.mark.asyncio
-    async def test_no_active_program_returns_none_status(
-        self,
-        service: AmnestyProgramService,
-        mock_amnesty_repo: MagicMock,
-    ) -> None:
-        """When no program exists, status is 'none' and is_active is False."""
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=None)
-
-        status = await service.get_amnesty_status(_TENANT_ID)
-        assert status.status == "none"
-        assert not status.is_active
-        assert status.program_id is None
-
-    @pytest.mark.asyncio
-    async def test_active_program_returned_correctly(
+    @pytest.mark.parametrize(
+        ("program_kwargs", "expected_status", "is_active", "transitions"),
+        [
+            (None, "none", False, False),
+            (
+                {"status": "active", "grace_period_expires_at": _NOW_PLUS_15D},
+                "active",
+                True,
+                False,
+            ),
+            (
+                {"status": "active", "grace_period_expires_at": _NOW_MINUS_1D},
+                "enforcing",
+                False,
+                True,
+            ),
+            (
+                {
+                    "status": "enforcing",
+                    "grace_period_expires_at": _NOW_MINUS_5D,
+                    "enforcement_started_at": _NOW_MINUS_5D,
+                },
+                "enforcing",
+                False,
+                False,
+            ),
+        ],
+        ids=["no-program", "active", "expired-grace-period", "already-enforcing"],
+    )
+    async def test_amnesty_status_transitions(
         self,
         service: AmnestyProgramService,
         mock_amnesty_repo: MagicMock,
+        program_kwargs: dict[str, object] | None,
+        expected_status: str,
+        is_active: bool,
+        transitions: bool,
     ) -> None:
-        """Active program with future expiry returns active status."""
-        program = _make_program(
-            status="active",
-            grace_period_days=30,
-            grace_period_expires_at=_NOW + timedelta(days=15),
-        )
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=program)
-
-        status = await service.get_amnesty_status(_TENANT_ID)
-        assert status.status == "active"
-        assert status.is_active
-        assert status.program_id == program.id
+        """Status, is_active, and the enforcing auto-transition follow the program state.
 
-    @pytest.mark.asyncio
-    async def test_expired_grace_period_transitions_to_enforcing(
-        self,
-        service: AmnestyProgramService,
-        mock_amnesty_repo: MagicMock,
-    ) -> None:
-        """Program with past expiry automatically transitions to 'enforcing'."""
-        program = _make_program(
-            status="active",
-            grace_period_days=30,
-            grace_period_expires_at=_NOW - timedelta(days=1),  # Past expiry
-        )
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=program)
-        mock_amnesty_repo.update_status = AsyncMock()
+        No program yields 'none'; a future expiry stays 'active'; a past expiry
+        transitions to 'enforcing' and persists it; an enforcing program stays put.
+        """
+        program = None if program_kwargs is None else _make_program(**program_kwargs)
+        mock_amnesty_repo.get_active_for_tenant.return_value = program
 
         status = await service.get_amnesty_status(_TENANT_ID)
-        assert status.status == "enforcing"
-        mock_amnesty_repo.update_status.assert_awaited_once()
-
-    @pytest.mark.asyncio
-    async def test_enforcing_program_not_active(
-        self,
-        service: AmnestyProgramService,
-        mock_amnesty_repo: MagicMock,
-    ) -> None:
-        """Program in enforcing status has is_active=False."""
-        program = _make_program(
-            status="enforcing",
-            grace_period_expires_at=_NOW - timedelta(days=5),
-            enforcement_started_at=_NOW - timedelta(days=5),
-        )
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=program)
 
-        status = await service.get_amnesty_status(_TENANT_ID)
-        # Status stays enforcing (already in terminal phase)
-        assert not status.is_active
+        assert status.status == expected_status
+        assert status.is_active is is_active
+        assert status.program_id == (program.id if program is not None else None)
+        assert mock_amnesty_repo.update_status.await_count == (1 if transitions else 0)
 
 
 class TestCancelAmnesty:
     """Tests for amnesty cancellation."""
 
-    @pytest.mark.asyncio
     async def test_cancel_active_program_calls_update(
         self,
         service: AmnestyProgramService,
@@ -317,8 +348,8 @@ class TestCancelAmnesty:
         """Cancelling an active program calls update_status with 'cancelled'."""
         program = _make_program(status="active")
         cancelled_program = _make_program(status="cancelled")
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=program)
-        mock_amnesty_repo.update_status = AsyncMock(return_value=cancelled_program)
+        mock_amnesty_repo.get_active_for_tenant.return_value = program
+        mock_amnesty_repo.update_status.return_value = cancelled_program
 
         result = await service.cancel_amnesty(_TENANT_ID, reason="Policy change")
 
@@ -327,14 +358,13 @@ class TestCancelAmnesty:
         call_kwargs = mock_amnesty_repo.update_status.call_args.kwargs
         assert call_kwargs.get("status") == "cancelled"
 
-    @pytest.mark.asyncio
     async def test_cancel_when_no_program_returns_none(
         self,
         service: AmnestyProgramService,
         mock_amnesty_repo: MagicMock,
     ) -> None:
         """Cancelling when no active program exists returns None."""
-        mock_amnesty_repo.get_active_for_tenant = AsyncMock(return_value=None)
+        mock_amnesty_repo.get_active_for_tenant.return_value = None
 
         result = await service.cancel_amnesty(_TENANT_ID)
         assert result is None
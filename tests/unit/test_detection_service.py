@@ -16,6 +16,7 @@ from decimal import Decimal
 import pytest
 
 from aumos_shadow_ai_toolkit.api.schemas_shadow import DNSQuery, NetworkLogEntry
+from aumos_shadow_ai_toolkit.core.models.shadow_detection import ShadowAIDetection
 from aumos_shadow_ai_toolkit.core.services.detection_service import (
     ShadowAIDetectionService,
     _HIGH_SENSITIVITY_BYTES,
@@ -26,22 +27,40 @@ _TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 _NOW = datetime.now(tz=timezone.utc)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service() -> ShadowAIDetectionService:
-    """ShadowAIDetectionService instance for tests."""
+    """ShadowAIDetectionService instance shared by the module; it holds only the tenant ID."""
     return ShadowAIDetectionService(tenant_id=_TENANT_ID)
 
 
+# Validated once; helpers copy these with model_copy, which skips re-validation.
+_DNS_TEMPLATE = DNSQuery(
+    queried_domain="api.openai.com",
+    source_ip="10.0.0.1",
+    queried_at=_NOW,
+    has_auth_header=False,
+)
+_LOG_ENTRY_TEMPLATE = NetworkLogEntry(
+    source_ip="10.0.0.1",
+    destination_domain="api.openai.com",
+    url_path=None,
+    request_size_bytes=0,
+    has_auth_header=False,
+    observed_at=_NOW,
+)
+
+
 def _make_dns_query(
     domain: str,
     source_ip: str = "10.0.0.1",
     has_auth: bool = False,
 ) -> DNSQuery:
-    return DNSQuery(
-        queried_domain=domain,
-        source_ip=source_ip,
-        queried_at=_NOW,
-        has_auth_header=has_auth,
+    return _DNS_TEMPLATE.model_copy(
+        update={
+            "queried_domain": domain,
+            "source_ip": source_ip,
+            "has_auth_header": has_auth,
+        }
     )
 
 
@@ -52,16 +71,36 @@ def _make_log_entry(
     has_auth: bool = False,
     source_ip: str = "10.0.0.1",
 ) -> NetworkLogEntry:
-    return NetworkLogEntry(
-        source_ip=source_ip,
-        destination_domain=domain,
-        url_path=url_path if url_path else None,
-        request_size_bytes=request_size_bytes,
-        has_auth_header=has_auth,
-        observed_at=_NOW,
+    return _LOG_ENTRY_TEMPLATE.model_copy(
+        update={
+            "source_ip": source_ip,
+            "destination_domain": domain,
+            "url_path": url_path if url_path else None,
+            "request_size_bytes": request_size_bytes,
+            "has_auth_header": has_auth,
+        }
     )
 
 
+@pytest.fixture(scope="module")
+async def mixed_dns_detections(
+    service: ShadowAIDetectionService,
+) -> list[ShadowAIDetection]:
+    """Detections from one analyze_dns_queries run over a mixed batch of queries.
+
+    The batch covers four providers, a repeated domain, and a non-AI domain so
+    the aggregate DNS assertions can share a single pipeline invocation.
+    """
+    queries = [
+        _make_dns_query("api.openai.com"),
+        *[_make_dns_query("api.anthropic.com")] * 3,
+        _make_dns_query("api.groq.com"),
+        _make_dns_query("api.mistral.ai"),
+        _make_dns_query("internal.company.com"),
+    ]
+    return await service.analyze_dns_queries(queries)
+
+
 # ---------------------------------------------------------------------------
 # classify_data_sensitivity tests
 # ---------------------------------------------------------------------------
@@ -70,81 +109,49 @@ def _make_log_entry(
 class TestClassifyDataSensitivity:
     """Tests for sensitivity classification heuristics."""
 
-    @pytest.mark.asyncio
-    async def test_fine_tuning_path_is_critical(self, service: ShadowAIDetectionService) -> None:
-        """Fine-tuning endpoints are always classified as critical."""
-        result = await service.classify_data_sensitivity(
-            domain="api.openai.com",
-            url_path="/v1/fine-tunes",
-            request_size_bytes=0,
-        )
-        assert result == "critical"
-
-    @pytest.mark.asyncio
-    async def test_very_large_payload_is_critical(self, service: ShadowAIDetectionService) -> None:
-        """Payloads above 128 KB are classified critical regardless of path."""
-        result = await service.classify_data_sensitivity(
-            domain="api.openai.com",
-            url_path="/v1/chat/completions",
-            request_size_bytes=131_073,
-        )
-        assert result == "critical"
-
-    @pytest.mark.asyncio
-    async def test_large_payload_known_path_is_high(
-        self, service: ShadowAIDetectionService
-    ) -> None:
-        """Payloads above 32 KB are high sensitivity."""
-        result = await service.classify_data_sensitivity(
-            domain="api.anthropic.com",
-            url_path="/v1/messages",
-            request_size_bytes=_HIGH_SENSITIVITY_BYTES + 1,
-        )
-        assert result == "high"
-
-    @pytest.mark.asyncio
-    async def test_known_path_small_payload_is_medium(
-        self, service: ShadowAIDetectionService
-    ) -> None:
-        """Known inference path with small payload is medium sensitivity."""
-        result = await service.classify_data_sensitivity(
-            domain="api.openai.com",
-            url_path="/v1/chat/completions",
-            request_size_bytes=100,
-        )
-        assert result == "medium"
-
-    @pytest.mark.asyncio
-    async def test_medium_payload_no_path_is_medium(
-        self, service: ShadowAIDetectionService
+    @pytest.mark.parametrize(
+        ("domain", "url_path", "request_size_bytes", "expected"),
+        [
+            # Fine-tuning endpoints are always critical
+            ("api.openai.com", "/v1/fine-tunes", 0, "critical"),
+            # Payloads above 128 KB are critical regardless of path
+            ("api.openai.com", "/v1/chat/completions", 131_073, "critical"),
+            # Payloads above 32 KB are high sensitivity
+            ("api.anthropic.com", "/v1/messages", _HIGH_SENSITIVITY_BYTES + 1, "high"),
+            # Known inference path with small payload is medium
+            ("api.openai.com", "/v1/chat/completions", 100, "medium"),
+            # Payload above 4 KB with no path is medium
+            ("api.groq.com", "", _MEDIUM_SENSITIVITY_BYTES + 1, "medium"),
+            # Tiny payload with no known path is low
+            ("api.openai.com", "", 256, "low"),
+            # Training path variants are always critical
+            ("api.cohere.com", "/training/jobs", 0, "critical"),
+        ],
+        ids=[
+            "fine-tuning-path",
+            "very-large-payload",
+            "large-payload-known-path",
+            "known-path-small-payload",
+            "medium-payload-no-path",
+            "tiny-payload-no-path",
+            "training-path",
+        ],
+    )
+    async def test_classify_data_sensitivity(
+        self,
+        service: ShadowAIDetectionService,
+        domain: str,
+        url_path: str,
+        request_size_bytes: int,
+        expected: str,
     ) -> None:
-        """Payload above 4 KB with no path is medium."""
-        result = await service.classify_data_sensitivity(
-            domain="api.groq.com",
-            url_path="",
-            request_size_bytes=_MEDIUM_SENSITIVITY_BYTES + 1,
-        )
-        assert result == "medium"
-
-    @pytest.mark.asyncio
-    async def test_tiny_payload_no_path_is_low(self, service: ShadowAIDetectionService) -> None:
-        """Tiny payload with no known path is low sensitivity."""
-        result = await service.classify_data_sensitivity(
-            domain="api.openai.com",
-            url_path="",
-            request_size_bytes=256,
-        )
-        assert result == "low"
-
-    @pytest.mark.asyncio
-    async def test_training_path_is_critical(self, service: ShadowAIDetectionService) -> None:
-        """Training path variants are always critical."""
+        """Path and payload size heuristics map to the expected sensitivity tier."""
         result = await service.classify_data_sensitivity(
-            domain="api.cohere.com",
-            url_path="/training/jobs",
-            request_size_bytes=0,
+            domain=domain,
+            url_path=url_path,
+            request_size_bytes=request_size_bytes,
         )
-        assert result == "critical"
+        assert result == expected
 
 
 # ---------------------------------------------------------------------------
@@ -155,7 +162,6 @@ class TestClassifyDataSensitivity:
 class TestComputeRiskScore:
     """Tests for the weighted risk score formula."""
 
-    @pytest.mark.asyncio
     async def test_critical_sensitivity_with_auth_is_high_risk(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -167,7 +173,6 @@ class TestComputeRiskScore:
         )
         assert score >= 70.0
 
-    @pytest.mark.asyncio
     async def test_low_sensitivity_no_auth_azure_is_low_risk(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -180,51 +185,42 @@ class TestComputeRiskScore:
         # Azure-openai has lower provider risk (0.3) and sensitivity is low
         assert score < 40.0
 
-    @pytest.mark.asyncio
-    async def test_score_within_valid_range(self, service: ShadowAIDetectionService) -> None:
+    @pytest.mark.parametrize("sensitivity", ["low", "medium", "high", "critical"])
+    @pytest.mark.parametrize("has_auth", [True, False], ids=["auth", "no-auth"])
+    async def test_score_within_valid_range(
+        self,
+        service: ShadowAIDetectionService,
+        sensitivity: str,
+        has_auth: bool,
+    ) -> None:
         """Risk score is always within 0.0–100.0."""
-        for sensitivity in ("low", "medium", "high", "critical"):
-            for has_auth in (True, False):
-                score = await service.compute_risk_score(
-                    sensitivity=sensitivity,
-                    provider="deepseek",
-                    has_auth=has_auth,
-                )
-                assert 0.0 <= score <= 100.0, (
-                    f"Score {score} out of range for {sensitivity}/{has_auth}"
-                )
-
-    @pytest.mark.asyncio
-    async def test_auth_increases_score(self, service: ShadowAIDetectionService) -> None:
-        """Having an auth header increases risk score vs no auth."""
-        score_with_auth = await service.compute_risk_score(
-            sensitivity="medium",
-            provider="openai",
-            has_auth=True,
+        score = await service.compute_risk_score(
+            sensitivity=sensitivity,
+            provider="deepseek",
+            has_auth=has_auth,
         )
-        score_no_auth = await service.compute_risk_score(
-            sensitivity="medium",
-            provider="openai",
-            has_auth=False,
+        assert 0.0 <= score <= 100.0, (
+            f"Score {score} out of range for {sensitivity}/{has_auth}"
         )
-        assert score_with_auth > score_no_auth
 
-    @pytest.mark.asyncio
-    async def test_high_risk_provider_raises_score(
-        self, service: ShadowAIDetectionService
+    @pytest.mark.parametrize(
+        ("higher", "lower"),
+        [
+            (("medium", "openai", True), ("medium", "openai", False)),
+            (("medium", "deepseek", False), ("medium", "azure-openai", False)),
+        ],
+        ids=["auth-header", "provider-weight"],
+    )
+    async def test_risk_factor_raises_score(
+        self,
+        service: ShadowAIDetectionService,
+        higher: tuple[str, str, bool],
+        lower: tuple[str, str, bool],
     ) -> None:
-        """Higher provider risk weight produces higher overall score."""
-        score_high_risk = await service.compute_risk_score(
-            sensitivity="medium",
-            provider="deepseek",  # weight 0.9
-            has_auth=False,
-        )
-        score_low_risk = await service.compute_risk_score(
-            sensitivity="medium",
-            provider="azure-openai",  # weight 0.3
-            has_auth=False,
-        )
-        assert score_high_risk > score_low_risk
+        """An auth header or a riskier provider (deepseek 0.9 vs azure 0.3) raises the score."""
+        score_higher = await service.compute_risk_score(*higher)
+        score_lower = await service.compute_risk_score(*lower)
+        assert score_higher > score_lower
 
 
 # ---------------------------------------------------------------------------
@@ -235,7 +231,6 @@ class TestComputeRiskScore:
 class TestAnalyzeDNSQueries:
     """Tests for DNS query analysis."""
 
-    @pytest.mark.asyncio
     async def test_known_domain_produces_detection(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -246,7 +241,6 @@ class TestAnalyzeDNSQueries:
         assert detections[0].provider == "openai"
         assert detections[0].tenant_id == _TENANT_ID
 
-    @pytest.mark.asyncio
     async def test_unknown_domain_produces_no_detection(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -255,51 +249,32 @@ class TestAnalyzeDNSQueries:
         detections = await service.analyze_dns_queries(queries)
         assert len(detections) == 0
 
-    @pytest.mark.asyncio
-    async def test_duplicate_domains_deduplicated(
-        self, service: ShadowAIDetectionService
+    def test_duplicate_domains_deduplicated(
+        self, mixed_dns_detections: list[ShadowAIDetection]
     ) -> None:
         """Multiple queries to same domain produce only one detection."""
-        queries = [
-            _make_dns_query("api.anthropic.com"),
-            _make_dns_query("api.anthropic.com"),
-            _make_dns_query("api.anthropic.com"),
-        ]
-        detections = await service.analyze_dns_queries(queries)
-        assert len(detections) == 1
+        anthropic = [d for d in mixed_dns_detections if d.provider == "anthropic"]
+        assert len(anthropic) == 1
 
-    @pytest.mark.asyncio
-    async def test_multiple_providers_produce_separate_detections(
-        self, service: ShadowAIDetectionService
+    def test_multiple_providers_produce_separate_detections(
+        self, mixed_dns_detections: list[ShadowAIDetection]
     ) -> None:
         """Different provider domains produce separate detection records."""
-        queries = [
-            _make_dns_query("api.openai.com"),
-            _make_dns_query("api.anthropic.com"),
-            _make_dns_query("api.groq.com"),
-        ]
-        detections = await service.analyze_dns_queries(queries)
-        assert len(detections) == 3
-        providers = {d.provider for d in detections}
-        assert providers == {"openai", "anthropic", "groq"}
+        assert len(mixed_dns_detections) == 4
+        providers = {d.provider for d in mixed_dns_detections}
+        assert providers == {"openai", "anthropic", "groq", "mistral"}
 
-    @pytest.mark.asyncio
-    async def test_detection_has_correct_tenant_id(
-        self, service: ShadowAIDetectionService
+    def test_detection_has_correct_tenant_id(
+        self, mixed_dns_detections: list[ShadowAIDetection]
     ) -> None:
         """Produced detections carry the correct tenant_id."""
-        queries = [_make_dns_query("api.mistral.ai")]
-        detections = await service.analyze_dns_queries(queries)
-        assert all(d.tenant_id == _TENANT_ID for d in detections)
+        assert {d.tenant_id for d in mixed_dns_detections} == {_TENANT_ID}
 
-    @pytest.mark.asyncio
-    async def test_detection_status_is_detected(
-        self, service: ShadowAIDetectionService
+    def test_detection_status_is_detected(
+        self, mixed_dns_detections: list[ShadowAIDetection]
     ) -> None:
         """New detections have status='detected'."""
-        queries = [_make_dns_query("api.groq.com")]
-        detections = await service.analyze_dns_queries(queries)
-        assert all(d.status == "detected" for d in detections)
+        assert {d.status for d in mixed_dns_detections} == {"detected"}
 
 
 # ---------------------------------------------------------------------------
@@ -310,7 +285,6 @@ class TestAnalyzeDNSQueries:
 class TestDetectFromNetworkLog:
     """Tests for the full network log detection pipeline."""
 
-    @pytest.mark.asyncio
     async def test_empty_log_produces_no_detections(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -318,7 +292,6 @@ class TestDetectFromNetworkLog:
         detections = await service.detect_from_network_log([])
         assert detections == []
 
-    @pytest.mark.asyncio
     async def test_non_ai_traffic_not_detected(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -330,7 +303,6 @@ class TestDetectFromNetworkLog:
         detections = await service.detect_from_network_log(entries)
         assert len(detections) == 0
 
-    @pytest.mark.asyncio
     async def test_ai_traffic_detected(self, service: ShadowAIDetectionService) -> None:
         """Network log entries to AI provider domain produce a detection."""
         entries = [
@@ -345,7 +317,6 @@ class TestDetectFromNetworkLog:
         assert len(detections) == 1
         assert detections[0].provider == "openai"
 
-    @pytest.mark.asyncio
     async def test_business_value_inferred_from_path(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -360,7 +331,6 @@ class TestDetectFromNetworkLog:
         detections = await service.detect_from_network_log(entries)
         assert detections[0].business_value_indicator == "text-generation"
 
-    @pytest.mark.asyncio
     async def test_multiple_entries_same_domain_aggregated(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -374,7 +344,6 @@ class TestDetectFromNetworkLog:
         assert len(detections) == 1
         assert detections[0].provider == "anthropic"
 
-    @pytest.mark.asyncio
     async def test_daily_cost_estimated_from_volume(
         self, service: ShadowAIDetectionService
     ) -> None:
@@ -385,7 +354,6 @@ class TestDetectFromNetworkLog:
         detections = await service.detect_from_network_log(entries)
         assert detections[0].estimated_daily_cost_usd > Decimal("0")
 
-    @pytest.mark.asyncio
     async def test_detection_has_unique_id(self, service: ShadowAIDetectionService) -> None:
         """Each detection gets a unique UUID."""
         entries = [
@@ -394,4 +362,4 @@ class TestDetectFromNetworkLog:
         ]
         detections = await service.detect_from_network_log(entries)
         ids = [d.id for d in detections]
-        assert len(ids) == len(set(ids))
+        assert len(ids) == len(frozenset(ids))
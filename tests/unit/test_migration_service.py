@@ -8,9 +8,11 @@ Covers:
 
 from __future__ import annotations
 
+import asyncio
+import copy
+import itertools
 import uuid
 from datetime import datetime, timezone
-from decimal import Decimal
 
 import pytest
 
@@ -18,36 +20,82 @@ from aumos_shadow_ai_toolkit.core.models.shadow_detection import ShadowAIDetecti
 from aumos_shadow_ai_toolkit.core.services.migration_service import (
     SHADOW_TO_AUMOS_MAPPING,
     MigrationProposalService,
+    MigrationSummary,
 )
+from tests.conftest import _COST_DEFAULT, _dec
 
 _TENANT_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
 _NOW = datetime.now(tz=timezone.utc)
+# Deterministic, unique detection IDs; tests need distinct IDs, not random ones.
+_ID_COUNTER = itertools.count(1)
+
+# Business value indicators that must each have an explicit mapping.
+_EXPECTED_INDICATORS: tuple[str, ...] = (
+    "code-assist",
+    "text-generation",
+    "data-analysis",
+    "image-generation",
+    "productivity",
+    "audio",
+    "embedding",
+    "fine-tuning",
+    "document-processing",
+    "search",
+    "summarisation",
+    "translation",
+    "classification",
+)
 
+# Spans all three complexity tiers and a module shared by several indicators.
+_SUMMARY_INDICATORS: tuple[str, ...] = (
+    "code-assist",
+    "text-generation",
+    "fine-tuning",
+    "productivity",
+    "data-analysis",
+    "audio",
+)
 
-def _make_detection(
-    business_value_indicator: str = "text-generation",
-    provider: str = "openai",
-) -> ShadowAIDetection:
-    """Create a minimal ShadowAIDetection for testing."""
+# Module the fallback mapping resolves to, captured at import.
+_UNKNOWN_MODULE = SHADOW_TO_AUMOS_MAPPING["unknown"]["module"]
+
+
+def _build_detection_template() -> ShadowAIDetection:
+    """Build the default ShadowAIDetection that _make_detection copies from."""
     detection = ShadowAIDetection.__new__(ShadowAIDetection)
-    detection.id = uuid.uuid4()
+    detection.id = uuid.UUID(int=0)
     detection.tenant_id = _TENANT_ID
     detection.source_ip = "10.0.0.1"
     detection.destination_domain = "api.openai.com"
-    detection.provider = provider
+    detection.provider = "openai"
     detection.estimated_data_sensitivity = "medium"
-    detection.estimated_daily_cost_usd = Decimal("0.01")
-    detection.compliance_risk_score = Decimal("45.00")
-    detection.business_value_indicator = business_value_indicator
+    detection.estimated_daily_cost_usd = _COST_DEFAULT
+    detection.compliance_risk_score = _dec(45.0)
+    detection.business_value_indicator = "text-generation"
     detection.status = "detected"
     detection.created_at = _NOW
     detection.updated_at = _NOW
     return detection
 
 
-@pytest.fixture
+_DETECTION_TEMPLATE = _build_detection_template()
+
+
+def _make_detection(
+    business_value_indicator: str = "text-generation",
+    provider: str = "openai",
+) -> ShadowAIDetection:
+    """Create a minimal ShadowAIDetection for testing."""
+    detection = copy.copy(_DETECTION_TEMPLATE)
+    detection.id = uuid.UUID(int=next(_ID_COUNTER))
+    detection.provider = provider
+    detection.business_value_indicator = business_value_indicator
+    return detection
+
+
+@pytest.fixture(scope="module")
 def service() -> MigrationProposalService:
-    """MigrationProposalService instance for testing."""
+    """MigrationProposalService instance shared by the module; the service is stateless."""
     return MigrationProposalService()
 
 
@@ -64,216 +112,167 @@ class TestMappingCoverage:
         """Fallback 'unknown' mapping must always be present."""
         assert "unknown" in SHADOW_TO_AUMOS_MAPPING
 
-    @pytest.mark.parametrize(
-        "indicator",
-        [
-            "code-assist",
-            "text-generation",
-            "data-analysis",
-            "image-generation",
-            "productivity",
-            "audio",
-            "embedding",
-            "fine-tuning",
-            "document-processing",
-            "search",
-            "summarisation",
-            "translation",
-            "classification",
-        ],
-    )
+    @pytest.mark.parametrize("indicator", _EXPECTED_INDICATORS, ids=_EXPECTED_INDICATORS)
     def test_indicator_mapped(self, indicator: str) -> None:
         """All expected business value indicators must have explicit mappings."""
         assert indicator in SHADOW_TO_AUMOS_MAPPING, (
             f"Indicator '{indicator}' is not mapped"
         )
 
-    def test_all_mappings_have_required_fields(self) -> None:
+    @pytest.mark.parametrize("indicator", list(SHADOW_TO_AUMOS_MAPPING))
+    def test_mapping_has_required_fields(self, indicator: str) -> None:
         """Every mapping must include module, complexity, hours, preservation_pct, description."""
         required_fields = {"module", "complexity", "hours", "preservation_pct", "description"}
-        for indicator, mapping in SHADOW_TO_AUMOS_MAPPING.items():
-            missing = required_fields - set(mapping.keys())
-            assert not missing, (
-                f"Mapping '{indicator}' is missing fields: {missing}"
-            )
+        missing = required_fields - set(SHADOW_TO_AUMOS_MAPPING[indicator].keys())
+        assert not missing, (
+            f"Mapping '{indicator}' is missing fields: {missing}"
+        )
 
-    def test_all_complexities_are_valid(self) -> None:
+    @pytest.mark.parametrize("indicator", list(SHADOW_TO_AUMOS_MAPPING))
+    def test_mapping_complexity_is_valid(self, indicator: str) -> None:
         """Every mapping must use a valid complexity tier."""
         valid_complexities = {"trivial", "moderate", "complex"}
-        for indicator, mapping in SHADOW_TO_AUMOS_MAPPING.items():
-            assert mapping["complexity"] in valid_complexities, (
-                f"Mapping '{indicator}' has invalid complexity '{mapping['complexity']}'"
-            )
+        complexity = SHADOW_TO_AUMOS_MAPPING[indicator]["complexity"]
+        assert complexity in valid_complexities, (
+            f"Mapping '{indicator}' has invalid complexity '{complexity}'"
+        )
 
-    def test_all_preservation_pcts_in_range(self) -> None:
+    @pytest.mark.parametrize("indicator", list(SHADOW_TO_AUMOS_MAPPING))
+    def test_mapping_preservation_pct_in_range(self, indicator: str) -> None:
         """Productivity preservation percentages must be between 0 and 100."""
-        for indicator, mapping in SHADOW_TO_AUMOS_MAPPING.items():
-            pct = float(mapping["preservation_pct"])
-            assert 0.0 <= pct <= 100.0, (
-                f"Mapping '{indicator}' has preservation_pct {pct} out of range"
-            )
+        pct = float(SHADOW_TO_AUMOS_MAPPING[indicator]["preservation_pct"])
+        assert 0.0 <= pct <= 100.0, (
+            f"Mapping '{indicator}' has preservation_pct {pct} out of range"
+        )
 
-    def test_all_hours_positive(self) -> None:
+    @pytest.mark.parametrize("indicator", list(SHADOW_TO_AUMOS_MAPPING))
+    def test_mapping_hours_positive(self, indicator: str) -> None:
         """Estimated migration hours must be positive."""
-        for indicator, mapping in SHADOW_TO_AUMOS_MAPPING.items():
-            hours = float(mapping["hours"])
-            assert hours > 0, (
-                f"Mapping '{indicator}' has non-positive hours {hours}"
-            )
+        hours = float(SHADOW_TO_AUMOS_MAPPING[indicator]["hours"])
+        assert hours > 0, (
+            f"Mapping '{indicator}' has non-positive hours {hours}"
+        )
 
 
 class TestGenerateProposal:
     """Tests for proposal generation from a single detection."""
 
-    @pytest.mark.asyncio
-    async def test_code_assist_maps_to_llm_serving(
-        self, service: MigrationProposalService
-    ) -> None:
-        """code-assist indicator maps to aumos-llm-serving."""
-        detection = _make_detection("code-assist")
-        proposal = await service.generate_proposal(detection)
-        assert proposal.proposed_aumos_module == "aumos-llm-serving"
-        assert proposal.migration_complexity == "trivial"
-
-    @pytest.mark.asyncio
-    async def test_text_generation_maps_to_text_engine(
-        self, service: MigrationProposalService
-    ) -> None:
-        """text-generation indicator maps to aumos-text-engine."""
-        detection = _make_detection("text-generation")
-        proposal = await service.generate_proposal(detection)
-        assert proposal.proposed_aumos_module == "aumos-text-engine"
-
-    @pytest.mark.asyncio
-    async def test_data_analysis_maps_to_context_graph(
-        self, service: MigrationProposalService
-    ) -> None:
-        """data-analysis indicator maps to aumos-context-graph."""
-        detection = _make_detection("data-analysis")
-        proposal = await service.generate_proposal(detection)
-        assert proposal.proposed_aumos_module == "aumos-context-graph"
-
-    @pytest.mark.asyncio
-    async def test_image_generation_maps_to_image_engine(
-        self, service: MigrationProposalService
-    ) -> None:
-        """image-generation indicator maps to aumos-image-engine."""
-        detection = _make_detection("image-generation")
-        proposal = await service.generate_proposal(detection)
-        assert proposal.proposed_aumos_module == "aumos-image-engine"
+    async def test_indicator_module_mapping(self, service: MigrationProposalService) -> None:
+        """Core indicators map to their AumOS modules; code-assist is a trivial migration."""
+        expected = {
+            "code-assist": "aumos-llm-serving",
+            "text-generation": "aumos-text-engine",
+            "data-analysis": "aumos-context-graph",
+            "image-generation": "aumos-image-engine",
+        }
+        proposals = await asyncio.gather(
+            *(service.generate_proposal(_make_detection(indicator)) for indicator in expected)
+        )
+        by_indicator = dict(zip(expected, proposals, strict=True))
+        for indicator, module in expected.items():
+            assert by_indicator[indicator].proposed_aumos_module == module, (
+                f"Indicator '{indicator}' mapped to the wrong module"
+            )
+        assert by_indicator["code-assist"].migration_complexity == "trivial"
 
-    @pytest.mark.asyncio
-    async def test_unknown_indicator_uses_fallback(
+    def test_unknown_indicator_uses_fallback(
         self, service: MigrationProposalService
     ) -> None:
         """Unknown business value indicator uses the 'unknown' fallback mapping."""
         detection = _make_detection("completely-unknown-indicator")
-        proposal = await service.generate_proposal(detection)
-        assert proposal.proposed_aumos_module == SHADOW_TO_AUMOS_MAPPING["unknown"]["module"]
+        proposal = service.generate_proposal_sync(detection)
+        assert proposal.proposed_aumos_module == _UNKNOWN_MODULE
 
-    @pytest.mark.asyncio
-    async def test_proposal_has_correct_detection_id(
+    def test_proposal_has_correct_detection_id(
         self, service: MigrationProposalService
     ) -> None:
         """Generated proposal references the correct detection ID."""
         detection = _make_detection("productivity")
-        proposal = await service.generate_proposal(detection)
+        proposal = service.generate_proposal_sync(detection)
         assert proposal.detection_id == detection.id
 
-    @pytest.mark.asyncio
-    async def test_proposal_has_correct_tenant_id(
+    def test_proposal_has_correct_tenant_id(
         self, service: MigrationProposalService
     ) -> None:
         """Generated proposal carries the detection's tenant ID."""
         detection = _make_detection("text-generation")
-        proposal = await service.generate_proposal(detection)
+        proposal = service.generate_proposal_sync(detection)
         assert proposal.tenant_id == _TENANT_ID
 
-    @pytest.mark.asyncio
     async def test_proposal_description_is_non_empty(
         self, service: MigrationProposalService
     ) -> None:
         """All proposals must include a non-empty compliance gain description."""
-        for indicator in SHADOW_TO_AUMOS_MAPPING:
-            detection = _make_detection(indicator)
-            proposal = await service.generate_proposal(detection)
+        detections = [_make_detection(indicator) for indicator in SHADOW_TO_AUMOS_MAPPING]
+        proposals = await asyncio.gather(
+            *(service.generate_proposal(detection) for detection in detections)
+        )
+        for detection, proposal in zip(detections, proposals, strict=True):
             assert proposal.compliance_gain_description, (
-                f"Empty description for indicator '{indicator}'"
+                f"Empty description for indicator '{detection.business_value_indicator}'"
             )
 
 
+@pytest.fixture(scope="module")
+async def full_summary(service: MigrationProposalService) -> MigrationSummary:
+    """Migration summary over one detection per _SUMMARY_INDICATORS entry, built once."""
+    detections = [_make_detection(indicator) for indicator in _SUMMARY_INDICATORS]
+    return await service.estimate_total_migration(detections)
+
+
 class TestEstimateTotalMigration:
     """Tests for aggregate migration effort estimation."""
 
-    @pytest.mark.asyncio
     async def test_empty_detections_produces_zero_summary(
         self, service: MigrationProposalService
     ) -> None:
         """Empty detection list produces a zero-value summary."""
         summary = await service.estimate_total_migration([])
         assert summary.total_detections == 0
-        assert summary.total_estimated_hours == Decimal("0.0")
+        assert summary.total_estimated_hours == _dec(0.0)
         assert summary.proposals == []
 
-    @pytest.mark.asyncio
-    async def test_total_hours_accumulates(self, service: MigrationProposalService) -> None:
+    def test_total_hours_accumulates(self, full_summary: MigrationSummary) -> None:
         """Total hours is sum of all individual proposal hours."""
-        detections = [
-            _make_detection("code-assist"),    # 2.0 hours
-            _make_detection("text-generation"), # 8.0 hours
-        ]
-        summary = await service.estimate_total_migration(detections)
-        expected = Decimal("2.0") + Decimal("8.0")
-        assert summary.total_estimated_hours == expected
-
-    @pytest.mark.asyncio
-    async def test_complexity_breakdown_correct(
-        self, service: MigrationProposalService
-    ) -> None:
+        expected = (
+            _dec(2.0)  # code-assist
+            + _dec(8.0)  # text-generation
+            + _dec(40.0)  # fine-tuning
+            + _dec(4.0)  # productivity
+            + _dec(16.0)  # data-analysis
+            + _dec(8.0)  # audio
+        )
+        assert full_summary.total_estimated_hours == expected
+
+    def test_complexity_breakdown_correct(self, full_summary: MigrationSummary) -> None:
         """Complexity breakdown counts reflect the generated proposals."""
-        detections = [
-            _make_detection("code-assist"),    # trivial
-            _make_detection("text-generation"), # moderate
-            _make_detection("fine-tuning"),    # complex
-        ]
-        summary = await service.estimate_total_migration(detections)
-        assert summary.complexity_breakdown["trivial"] == 1
-        assert summary.complexity_breakdown["moderate"] == 1
-        assert summary.complexity_breakdown["complex"] == 1
-
-    @pytest.mark.asyncio
-    async def test_module_breakdown_correct(
-        self, service: MigrationProposalService
-    ) -> None:
+        assert full_summary.complexity_breakdown["trivial"] == 2  # code-assist, productivity
+        assert full_summary.complexity_breakdown["moderate"] == 3  # text-generation, data-analysis, audio
+        assert full_summary.complexity_breakdown["complex"] == 1  # fine-tuning
+
+    def test_module_breakdown_correct(self, full_summary: MigrationSummary) -> None:
         """Module breakdown counts reflect the target modules of proposals."""
-        detections = [
-            _make_detection("code-assist"),    # aumos-llm-serving
-            _make_detection("productivity"),   # aumos-llm-serving
-            _make_detection("text-generation"), # aumos-text-engine
-        ]
-        summary = await service.estimate_total_migration(detections)
-        assert summary.module_breakdown.get("aumos-llm-serving", 0) == 2
-        assert summary.module_breakdown.get("aumos-text-engine", 0) == 1
-
-    @pytest.mark.asyncio
-    async def test_proposal_count_matches_detection_count(
-        self, service: MigrationProposalService
+        assert full_summary.module_breakdown.get("aumos-llm-serving", 0) == 3
+        assert full_summary.module_breakdown.get("aumos-text-engine", 0) == 1
+        assert full_summary.module_breakdown.get("aumos-context-graph", 0) == 1
+        assert full_summary.module_breakdown.get("aumos-audio-engine", 0) == 1
+
+    def test_proposal_count_matches_detection_count(
+        self, full_summary: MigrationSummary
     ) -> None:
         """One proposal is generated per detection."""
-        detections = [_make_detection(ind) for ind in ("code-assist", "data-analysis", "audio")]
-        summary = await service.estimate_total_migration(detections)
-        assert len(summary.proposals) == 3
-        assert summary.total_detections == 3
+        assert len(full_summary.proposals) == len(_SUMMARY_INDICATORS)
+        assert full_summary.total_detections == len(_SUMMARY_INDICATORS)
 
-    @pytest.mark.asyncio
-    async def test_average_preservation_pct_computed(
-        self, service: MigrationProposalService
-    ) -> None:
+    def test_average_preservation_pct_computed(self, full_summary: MigrationSummary) -> None:
         """Average preservation percentage is the mean of individual values."""
-        detections = [
-            _make_detection("code-assist"),    # 95%
-            _make_detection("data-analysis"),  # 85%
-        ]
-        summary = await service.estimate_total_migration(detections)
-        expected = round((Decimal("95.00") + Decimal("85.00")) / 2, 2)
-        assert summary.average_preservation_pct == expected
+        total = (
+            _dec(95.0)  # code-assist
+            + _dec(90.0)  # text-generation
+            + _dec(75.0)  # fine-tuning
+            + _dec(92.0)  # productivity
+            + _dec(85.0)  # data-analysis
+            + _dec(88.0)  # audio
+        )
+        expected = round(total / len(_SUMMARY_INDICATORS), 2)
+        assert full_summary.average_preservation_pct == expected